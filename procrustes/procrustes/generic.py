@@ -24,8 +24,12 @@
 
 import numpy as np
 from procrustes.utils import compute_error, ProcrustesResult, setup_input_arrays
-# MPE: from scipy.linalg import pinv, pinv2, thanks to Lydia Kienbaum
-from scipy.linalg import pinv
+from scipy.linalg import lstsq
+
+__all__ = [
+    "generic",
+    "generic_batch",
+]
 
 
 def generic(
@@ -79,17 +83,19 @@ def generic(
         If True, zero rows (with values less than 1.0e-8) at the bottom of the intial
         :math:`\mathbf{A}` and :math:`\mathbf{B}` matrices are removed.
     check_finite : bool, optional
-        If True, convert the input to an array, checking for NaNs or Infs.
+        If True, convert the input to an array, checking for NaNs or Infs. The inputs are checked
+        once, while being prepared; the least-squares solver itself skips this check, because the
+        prepared arrays cannot contain NaNs or Infs when the inputs are finite.
     weight : ndarray, optional
         The 1D-array representing the weights of each row of :math:`\mathbf{A}`. This defines the
         elements of the diagonal matrix :math:`\mathbf{W}` that is multiplied by :math:`\mathbf{A}`
         matrix, i.e., :math:`\mathbf{A} \rightarrow \mathbf{WA}`.
-    use_svd : bool, optional MPE: NOT needed anymore
-        If True, the (Moore-Penrose) pseudo-inverse is computed by singular-value decomposition
-        (SVD) including all 'large' singular values (using `scipy.linalg.pinv2`).
-        If False, the the (Moore-Penrose) pseudo-inverse is computed by least-squares solver
-        (using `scipy.linalg.pinv`). The least-squares implementation is less efficient, but more
-        robust, than the SVD implementation.
+    use_svd : bool, optional
+        If True, the least-squares problem is solved with the singular-value decomposition (SVD)
+        of :math:`\mathbf{A}` (using the ``'gelsd'`` LAPACK driver of `scipy.linalg.lstsq`).
+        If False, the least-squares problem is solved with a complete orthogonal factorization of
+        :math:`\mathbf{A}` based on QR with column pivoting (using the ``'gelsy'`` LAPACK driver).
+        The SVD implementation is less efficient, but more robust, than the QR implementation.
 
     Returns
     -------
@@ -103,9 +109,17 @@ def generic(
     .. math::
         \mathbf{X}_\text{opt} = {(\mathbf{A}^{\top}\mathbf{A})}^{-1} \mathbf{A}^{\top} \mathbf{B}
 
+    These are solved by factorizing :math:`\mathbf{A}` directly instead of forming and inverting
+    :math:`\mathbf{A}^{\top}\mathbf{A}`, which would square the condition number of the problem.
+    When both :math:`\mathbf{A}` and :math:`\mathbf{B}` are single precision arrays, the problem
+    is solved in single precision, which halves the memory traffic of the solver.
+
     If :math:`m < n`, the transformation matrix :math:`\mathbf{T}_\text{opt}` is not unique,
     because the system of equations is underdetermined (i.e., there are fewer equations than
-    unknowns).
+    unknowns). In this case (and whenever :math:`\mathbf{A}` is rank-deficient), the returned
+    transformation matrix is the minimum-norm solution, computed from a factorization of the
+    :math:`m \times n` matrix :math:`\mathbf{A}` without ever forming the larger
+    :math:`n \times n` matrix :math:`\mathbf{A}^{\top}\mathbf{A}`.
 
     """
     if not isinstance(use_svd, bool):
@@ -115,15 +129,115 @@ def generic(
     new_a, new_b = setup_input_arrays(
         a, b, unpad_col, unpad_row, pad, translate, scale, check_finite, weight,
     )
-    # compute the generic solution (pinv2 deprecated)
-    #if use_svd:
-        # Use the singular value decomposition, much faster but less robust.
-    #    a_inv = pinv2(np.dot(new_a.T, new_a))
-    #else:
-    # Uses the least-squared method.
-    a_inv = pinv(np.dot(new_a.T, new_a))
-
-    array_x = np.linalg.multi_dot([a_inv, new_a.T, new_b])
+    # keep single precision inputs in single precision (weighting promotes them to double),
+    # so that lstsq dispatches to the single precision LAPACK drivers
+    if np.promote_types(a.dtype, b.dtype) == np.float32:
+        new_a, new_b = new_a.astype(np.float32, copy=False), new_b.astype(np.float32, copy=False)
+    if _has_orthonormal_columns(new_a):
+        # A^T A is the identity matrix, so the solution reduces to A^T B
+        array_x = np.dot(new_a.T, new_b)
+    else:
+        # compute the generic solution with a least-squares solver acting directly on A; singular
+        # values below max(m, n) * eps (relative to the largest one) are discarded, like pinv does
+        lapack_driver = "gelsd" if use_svd else "gelsy"
+        cond = max(new_a.shape) * np.finfo(np.result_type(new_a, new_b, np.float32)).eps
+        array_x, *_ = lstsq(new_a, new_b, cond=cond, check_finite=False,
+                            lapack_driver=lapack_driver)
     # compute one-sided error
     e_opt = compute_error(new_a, new_b, array_x)
     return ProcrustesResult(error=e_opt, new_a=new_a, new_b=new_b, t=array_x, s=None)
+
+
+def _has_orthonormal_columns(array, tol=1.0e-10):
+    r"""Check whether the columns of an array are orthonormal, i.e. :math:`A^{\top}A = I`."""
+    m, n = array.shape
+    if m < n:
+        return False
+    # cheap check of the first columns, to avoid forming A^T A when it is clearly not the identity
+    if abs(np.dot(array[:, 0], array[:, 0]) - 1.0) > tol:
+        return False
+    if n > 1 and abs(np.dot(array[:, 0], array[:, 1])) > tol:
+        return False
+    return np.allclose(np.dot(array.T, array), np.eye(n), rtol=0.0, atol=tol)
+
+
+def generic_batch(
+    a_list,
+    b_list,
+    pad=True,
+    translate=False,
+    scale=False,
+    unpad_col=False,
+    unpad_row=False,
+    check_finite=True,
+    weight=None,
+):
+    r"""Perform generic one-sided Procrustes on a batch of matrix pairs.
+
+    Given a list of matrices :math:`\mathbf{A}_k` and reference matrices :math:`\mathbf{B}_k`, find
+    the transformation matrices :math:`\mathbf{T}_k` that make :math:`\mathbf{A}_k\mathbf{T}_k` as
+    close as possible to :math:`\mathbf{B}_k`, as :func:`generic` does for a single pair. All the
+    transformations are computed together, which amortizes the per-call overhead of the solver
+    when many small problems of the same shape are solved.
+
+    Parameters
+    ----------
+    a_list : list of ndarray
+        The 2d-arrays :math:`\mathbf{A}_k` which are going to be transformed.
+    b_list : list of ndarray
+        The 2d-arrays :math:`\mathbf{B}_k` representing the reference matrices.
+    pad : bool, optional
+        Add zero rows (at the bottom) and/or columns (to the right-hand side) of matrices
+        :math:`\mathbf{A}_k` and :math:`\mathbf{B}_k` so that they have the same shape.
+    translate : bool, optional
+        If True, all arrays are centered at origin (columns of the arrays will have mean zero).
+    scale : bool, optional
+        If True, all arrays are normalized with respect to the Frobenius norm.
+    unpad_col : bool, optional
+        If True, zero columns (with values less than 1.0e-8) on the right-hand side of the intial
+        matrices are removed.
+    unpad_row : bool, optional
+        If True, zero rows (with values less than 1.0e-8) at the bottom of the intial matrices are
+        removed.
+    check_finite : bool, optional
+        If True, convert the input to an array, checking for NaNs or Infs.
+    weight : ndarray, optional
+        The 1D-array representing the weights of each row of every :math:`\mathbf{A}_k`.
+
+    Returns
+    -------
+    res : list of ProcrustesResult
+        The Procrustes results of each pair represented as class:`utils.ProcrustesResult` objects.
+
+    Notes
+    -----
+    After the pre-processing, all the pairs must have the same shape. Each transformation matrix is
+    the minimum-norm least-squares solution :math:`\mathbf{T}_k = \mathbf{A}_k^{+}\mathbf{B}_k`,
+    where the pseudo-inverses of the whole stack of matrices are computed with a single call to
+    `numpy.linalg.pinv`.
+
+    """
+    if len(a_list) != len(b_list):
+        raise ValueError(
+            f"Arguments a_list & b_list should have the same length. "
+            f"Given {len(a_list)} and {len(b_list)}."
+        )
+    # check inputs
+    pairs = [
+        setup_input_arrays(a, b, unpad_col, unpad_row, pad, translate, scale, check_finite, weight)
+        for a, b in zip(a_list, b_list)
+    ]
+    shapes = {new_a.shape for new_a, _ in pairs}
+    if len(shapes) > 1:
+        raise ValueError(f"All pairs of arrays should have the same shape. Given shapes {shapes}.")
+    stack_a = np.array([new_a for new_a, _ in pairs])
+    stack_b = np.array([new_b for _, new_b in pairs])
+    # compute all the generic solutions at once, using the same cutoff as generic
+    cond = max(stack_a.shape[1:]) * np.finfo(np.result_type(stack_a, stack_b, np.float32)).eps
+    stack_x = np.matmul(np.linalg.pinv(stack_a, rcond=cond), stack_b)
+    # compute one-sided errors
+    errors = np.sum(np.square(np.matmul(stack_a, stack_x) - stack_b), axis=(1, 2))
+    return [
+        ProcrustesResult(error=error, new_a=new_a, new_b=new_b, t=array_x, s=None)
+        for error, (new_a, new_b), array_x in zip(errors, pairs, stack_x)
+    ]
@@ -24,7 +24,7 @@
 
 import numpy as np
 from numpy.testing import assert_almost_equal, assert_raises
-from procrustes.generic import generic
+from procrustes.generic import generic, generic_batch
 import pytest
 
 
@@ -135,3 +135,80 @@ def test_generic_rectangular_translate_scale(m, n):
     centered_b = array_b - np.mean(array_b, axis=0)
     assert_almost_equal(res.new_a, centered_a / np.linalg.norm(centered_a), decimal=6)
     assert_almost_equal(res.new_b, centered_b / np.linalg.norm(centered_b), decimal=6)
+
+
+@pytest.mark.parametrize("m, n", np.random.randint(50, 100, (5, 2)))
+def test_generic_rank_deficient(m, n):
+    r"""Test generic Procrustes with rank-deficient matrices against the minimum-norm solution."""
+    # random rank-deficient input array (size=mxn) with its last column duplicated
+    array_a = np.random.uniform(-2.0, 2.0, (m, n))
+    array_a[:, -1] = array_a[:, 0]
+    array_b = np.random.uniform(-2.0, 2.0, (m, n))
+    expected, *_ = np.linalg.lstsq(array_a, array_b, rcond=None)
+    for use_svd in [True, False]:
+        res = generic(array_a, array_b, translate=False, scale=False, use_svd=use_svd)
+        assert_almost_equal(res.t, expected, decimal=6)
+
+
+@pytest.mark.parametrize("m, n", np.random.randint(2, 50, (10, 2)))
+def test_generic_rectangular_wide_minimum_norm(m, n):
+    r"""Test generic Procrustes with random wide matrices returns the minimum-norm solution."""
+    # random wide input & transformation arrays (size=mx(m+n))
+    array_a = np.random.uniform(-2.0, 2.0, (m, m + n))
+    array_x = np.random.uniform(-2.0, 2.0, (m + n, m + n))
+    array_b = np.dot(array_a, array_x)
+    res = generic(array_a, array_b, translate=False, scale=False)
+    assert_almost_equal(res.error, 0.0, decimal=6)
+    # minimum-norm solution lies in the row space of A, i.e. T = pinv(A) B
+    assert_almost_equal(res.t, np.dot(np.linalg.pinv(array_a), array_b), decimal=6)
+
+
+@pytest.mark.parametrize("m, n", np.random.randint(2, 20, (10, 2)))
+def test_generic_batch(m, n):
+    r"""Test batched generic Procrustes against generic Procrustes of each pair."""
+    # random input & reference arrays (size=kxmxn)
+    array_a = np.random.uniform(-2.0, 2.0, (7, m, n))
+    array_b = np.random.uniform(-2.0, 2.0, (7, m, n))
+    results = generic_batch(list(array_a), list(array_b), translate=True, scale=True)
+    assert len(results) == 7
+    for a, b, res in zip(array_a, array_b, results):
+        expected = generic(a, b, translate=True, scale=True)
+        assert_almost_equal(res.error, expected.error, decimal=6)
+        assert_almost_equal(res.t, expected.t, decimal=6)
+        assert_almost_equal(res.new_a, expected.new_a, decimal=6)
+        assert_almost_equal(res.new_b, expected.new_b, decimal=6)
+
+
+def test_generic_batch_raises():
+    r"""Test batched generic Procrustes with mismatching inputs."""
+    array_a = [np.random.uniform(-2.0, 2.0, (4, 3)), np.random.uniform(-2.0, 2.0, (5, 3))]
+    array_b = [np.random.uniform(-2.0, 2.0, (4, 3)), np.random.uniform(-2.0, 2.0, (5, 3))]
+    assert_raises(ValueError, generic_batch, array_a, array_b[:1])
+    assert_raises(ValueError, generic_batch, array_a, array_b)
+
+
+@pytest.mark.parametrize("m, n", np.random.randint(50, 100, (5, 2)))
+def test_generic_single_precision(m, n):
+    r"""Test generic Procrustes keeps single precision inputs in single precision."""
+    array_a = np.random.uniform(-2.0, 2.0, (m, n)).astype(np.float32)
+    array_x = np.random.uniform(-2.0, 2.0, (n, n)).astype(np.float32)
+    array_b = np.dot(array_a, array_x)
+    weight = np.random.uniform(0.5, 1.0, m)
+    for use_svd in [True, False]:
+        res = generic(array_a, array_b, weight=weight, use_svd=use_svd)
+        assert res.new_a.dtype == np.float32
+        assert res.t.dtype == np.float32
+        expected = generic(array_a.astype(float), array_b.astype(float), weight=weight)
+        assert_almost_equal(res.t, expected.t, decimal=2)
+
+
+@pytest.mark.parametrize("m, n", np.random.randint(2, 100, (10, 2)))
+def test_generic_orthonormal_columns(m, n):
+    r"""Test generic Procrustes with random matrices having orthonormal columns."""
+    # random input array with orthonormal columns (size=(m+n)xn) & transformation (size=nxn)
+    array_a, _ = np.linalg.qr(np.random.uniform(-2.0, 2.0, (m + n, n)))
+    array_x = np.random.uniform(-2.0, 2.0, (n, n))
+    array_b = np.dot(array_a, array_x)
+    res = generic(array_a, array_b, translate=False, scale=False)
+    assert_almost_equal(res.error, 0.0, decimal=6)
+    assert_almost_equal(res.t, array_x, decimal=6)
@@ -45,6 +45,7 @@ import scipy as sp  # SciPy (signal and image processing library)
 
 # :: External Imports Submodules
 import scipy.ndimage  # SciPy: ND-image Manipulation
+import scipy.fft  # SciPy: Discrete Fourier Transforms
 
 # :: Local Imports
 import pymrt as mrt
@@ -1077,6 +1078,35 @@ def apply_mask(
     return arr
 
 
+# ======================================================================
+def _background_dtype(
+        arr,
+        background):
+    """
+    Compute the data-type of an array promoted to fit a background value.
+
+    Python scalars do not widen the data-type of an array on their own
+    (see NEP 50), hence the smallest data-type holding the background
+    value is also taken into account.
+
+    Args:
+        arr (np.ndarray): The input array.
+        background (int|float|complex): The background value.
+
+    Returns:
+        dtype (np.dtype): The promoted data-type.
+
+    Examples:
+        >>> arr = np.zeros(2, dtype=np.uint8)
+        >>> [_background_dtype(arr, x) for x in (0, -1, 300)]
+        [dtype('uint8'), dtype('int16'), dtype('uint16')]
+        >>> _background_dtype(arr.astype(np.float32), 0.0)
+        dtype('float32')
+    """
+    return np.result_type(
+        np.result_type(arr, background), np.min_scalar_type(background))
+
+
 # ======================================================================
 def frame(
         arr,
@@ -1100,6 +1130,13 @@ def frame(
 
     Returns:
         result (np.ndarray): The result array with added borders.
+            Its data-type is that of `arr`, promoted to fit `background`.
+
+    Examples:
+        >>> arr = np.ones((2, 2), dtype=np.uint8)
+        >>> result = frame(arr, 1, -1)
+        >>> result.dtype, result[0, 0], result.shape
+        (dtype('int16'), np.int16(-1), (4, 4))
 
     See Also:
         reframe()
@@ -1114,13 +1151,10 @@ def frame(
         else:
             borders = [
                 round(border * dim) for dim, border in zip(arr.shape, borders)]
-    result = np.full(
-        [dim + 2 * border for dim, border in zip(arr.shape, borders)],
-        background)
-    inner = [
-        slice(border, border + dim, None)
-        for dim, border in zip(arr.shape, borders)]
-    result[inner] = arr
+    result = np.pad(
+        arr.astype(_background_dtype(arr, background), copy=False),
+        [(border, border) for border in borders],
+        mode='constant', constant_values=background)
     return result
 
 
@@ -1143,11 +1177,21 @@ def reframe(
 
     Returns:
         result (np.ndarray): The result array with added borders.
+            Its data-type is that of `arr`, promoted to fit `background`.
 
     Raises:
         IndexError: input and output shape sizes must match.
         ValueError: output shape cannot be smaller than the input shape.
 
+    Examples:
+        >>> arr = np.ones((2, 2), dtype=np.uint8)
+        >>> result = reframe(arr, (3, 4), 300)
+        >>> result.dtype, result[0, 0], result.shape
+        (dtype('uint16'), np.uint16(300), (3, 4))
+        >>> reframe(arr, (2, 4), 0)
+        array([[0, 1, 1, 0],
+               [0, 1, 1, 0]], dtype=uint8)
+
     See Also:
         frame()
     """
@@ -1155,16 +1199,72 @@ def reframe(
         raise IndexError('number of dimensions must match')
     elif any([old > new for old, new in zip(arr.shape, new_shape)]):
         raise ValueError('new shape cannot be smaller than the old one.')
-    result = np.full(new_shape, background)
     borders = [
         round((new - old) / 2.0) for old, new in zip(arr.shape, new_shape)]
-    inner = [
-        slice(border, border + dim, None)
-        for dim, border in zip(arr.shape, borders)]
-    result[inner] = arr
+    result = np.pad(
+        arr.astype(_background_dtype(arr, background), copy=False),
+        [(border, new - old - border)
+         for old, new, border in zip(arr.shape, new_shape, borders)],
+        mode='constant', constant_values=background)
     return result
 
 
+# ======================================================================
+def common_shape(
+        shapes,
+        combiner=max):
+    """
+    Compute a shape compatible with all the input shapes.
+
+    Missing (trailing) dimensions are considered singletons.
+
+    Args:
+        shapes (iterable[iterable[int]]): The input shapes.
+        combiner (callable): The function combining the sizes.
+            Must accept the sizes of a given dimension as positional
+            arguments, e.g. `max()` or `pymrt.utils.lcm()`.
+
+    Returns:
+        new_shape (tuple[int]): The combined shape.
+
+    Examples:
+        >>> common_shape([(2, 3), (4, 1, 5)])
+        (4, 3, 5)
+        >>> common_shape([(2, 3), (3, 2)], mrt.utils.lcm)
+        (6, 6)
+    """
+    shapes = [tuple(shape) for shape in shapes]
+    num_dims = max(len(shape) for shape in shapes)
+    return tuple(
+        int(combiner(*[
+            shape[i] if i < len(shape) else 1 for shape in shapes]))
+        for i in range(num_dims))
+
+
+# ======================================================================
+def common_dtype(
+        dtypes):
+    """
+    Compute a data-type compatible with all the input data-types.
+
+    Args:
+        dtypes (iterable[data-type]): The input data-types.
+
+    Returns:
+        dtype (np.dtype): The promoted data-type.
+            If `dtypes` is empty, this is `bool`.
+
+    Examples:
+        >>> common_dtype([np.uint8, np.int16])
+        dtype('int16')
+        >>> common_dtype([np.int16, np.float32])
+        dtype('float32')
+        >>> common_dtype([])
+        dtype('bool')
+    """
+    return functools.reduce(np.promote_types, dtypes, np.dtype(bool))
+
+
 # ======================================================================
 def multi_reframe(
         arrs,
@@ -1194,23 +1294,14 @@ def multi_reframe(
     """
     # calculate new shape
     if new_shape is None:
-        shapes = [arr.shape for arr in arrs]
-        new_shape = [1] * max([len(shape) for shape in shapes])
-        shape_arr = np.ones((len(shapes), len(new_shape))).astype(np.int)
-        for i, shape in enumerate(shapes):
-            shape_arr[i, :len(shape)] = np.array(shape)
-        new_shape = tuple(
-            max(*list(shape_arr[:, i]))
-            for i in range(len(new_shape)))
+        new_shape = common_shape([arr.shape for arr in arrs])
+    else:
+        new_shape = tuple(new_shape)
 
     if dtype is None:
-        # dtype = functools.reduce(
-        #     (lambda x, y: np.promote_types(x, y.dtype)), arrs)
-        dtype = bool
-        for arr in arrs:
-            dtype = np.promote_types(dtype, arr.dtype)
+        dtype = common_dtype([arr.dtype for arr in arrs])
 
-    result = np.array(new_shape + (len(arrs),), dtype=dtype)
+    result = np.zeros(new_shape + (len(arrs),), dtype=dtype)
     for i, arr in enumerate(arrs):
         # ratio should not be kept: keep_ratio_method=None
         result[..., i] = reframe(arr, new_shape, background=background)
@@ -1278,6 +1369,90 @@ def shape2zoom(
     return zoom_factors
 
 
+# ======================================================================
+def _ndimage_zoom(
+        arr,
+        factors,
+        interp_order=0):
+    """
+    Zoom an array using `sp.ndimage.zoom()` on as few dimensions as possible.
+
+    The singleton axes that are not zoomed are removed before zooming and,
+    if at least two trailing axes are zoomed, the leading axes that are not
+    zoomed are looped through, so that only the remaining axes are zoomed
+    at once.
+    This is much faster because `sp.ndimage.zoom()` slows down considerably
+    with the number of dimensions, while the result does not change.
+    With a single zoomed axis, the Python loop over each line would cost
+    more than it saves, hence the array is zoomed at once.
+
+    Args:
+        arr (np.ndarray): The input array.
+        factors (iterable[int|float]): The zoom factors.
+            Its size must match the number of dims of `arr`.
+        interp_order (int): Order of the spline interpolation.
+            0: nearest. Accepted range: [0, 5].
+
+    Returns:
+        result (np.ndarray): The output array.
+    """
+    squeeze_axes = tuple(
+        i for i, (dim, factor) in enumerate(zip(arr.shape, factors))
+        if dim == 1 and factor == 1)
+    if len(squeeze_axes) == arr.ndim:
+        return arr.copy()
+    arr = np.squeeze(arr, squeeze_axes)
+    factors = [
+        factor for i, factor in enumerate(factors) if i not in squeeze_axes]
+    # number of leading axes that are not zoomed (at least one is kept)
+    num_lead = 0
+    while num_lead < len(factors) - 1 and factors[num_lead] == 1:
+        num_lead += 1
+    if num_lead and len(factors) - num_lead > 1:
+        result = np.stack([
+            sp.ndimage.zoom(x, factors[num_lead:], order=interp_order)
+            for x in arr.reshape((-1,) + arr.shape[num_lead:])])
+        result = result.reshape(arr.shape[:num_lead] + result.shape[1:])
+    else:
+        result = sp.ndimage.zoom(arr, factors, order=interp_order)
+    return np.expand_dims(result, squeeze_axes)
+
+
+# ======================================================================
+def _fft_zoom(
+        arr,
+        factors):
+    """
+    Zoom an array by cropping or zero-padding its Fourier spectrum.
+
+    This is equivalent to an ideal (band-limited) interpolation, therefore
+    no anti-aliasing pre-filter is required when downsampling.
+    The shape of the result is computed as in `sp.ndimage.zoom()`.
+
+    Args:
+        arr (np.ndarray): The input array.
+        factors (iterable[int|float]): The zoom factors.
+            Its size must match the number of dims of `arr`.
+
+    Returns:
+        result (np.ndarray): The output array.
+            This is real if `arr` is real.
+    """
+    new_shape = tuple(
+        int(round(dim * factor)) for dim, factor in zip(arr.shape, factors))
+    spectrum = sp.fft.fftshift(sp.fft.fftn(arr, workers=-1))
+    result = np.zeros(new_shape, dtype=spectrum.dtype)
+    old_inner, new_inner = [], []
+    for old, new in zip(arr.shape, new_shape):
+        dim = min(old, new)
+        old_inner.append(slice(old // 2 - dim // 2, old // 2 - dim // 2 + dim))
+        new_inner.append(slice(new // 2 - dim // 2, new // 2 - dim // 2 + dim))
+    result[tuple(new_inner)] = spectrum[tuple(old_inner)]
+    result = sp.fft.ifftn(sp.fft.ifftshift(result), workers=-1)
+    result *= result.size / arr.size
+    return result if np.iscomplexobj(arr) else result.real
+
+
 # ======================================================================
 def zoom(
         arr,
@@ -1302,9 +1477,14 @@ def zoom(
             If iterable, its size must match the number of dims of `arr`.
             If int, uses an isotropic window with the specified size.
             If None, the window is calculated automatically from the `zoom`
-            parameter.
-        interp_order (int): Order of the spline interpolation.
+            parameter (only axes with a factor of ~1/3 or smaller, i.e.
+            shrunk to a third of their size or less, get filtered).
+            Axes with a window size of 1 or smaller are not filtered.
+            This is ignored if `interp_order` is None.
+        interp_order (int|None): Order of the spline interpolation.
             0: nearest. Accepted range: [0, 5].
+            If None, uses Fourier interpolation (band-limited), which is
+            preferable for smooth images, but not for masks or labels.
         extra_dim (bool): Force extra dimensions in the zoom parameters.
         fill_dim (bool): Dimensions not specified are left untouched.
 
@@ -1315,11 +1495,17 @@ def zoom(
         geometry.zoom
     """
     factors, shape = zoom_prepare(factors, arr.shape, extra_dim, fill_dim)
-    if window is None:
-        window = [round(1.0 / (2.0 * x)) for x in factors]
-    arr = sp.ndimage.uniform_filter(arr, window)
-    arr = sp.ndimage.zoom(
-        arr.reshape(shape), factors, order=interp_order)
+    if interp_order is None:
+        arr = _fft_zoom(arr.reshape(shape), factors)
+    else:
+        if window is None:
+            window = [round(1.0 / (2.0 * x)) for x in factors]
+        window = mrt.utils.auto_repeat(window, arr.ndim, check=True)
+        # separable filter, only along the axes that need it (if any)
+        for i, size in enumerate(window):
+            if size > 1:
+                arr = sp.ndimage.uniform_filter1d(arr, size, axis=i)
+        arr = _ndimage_zoom(arr.reshape(shape), factors, interp_order)
     return arr
 
 
@@ -1349,6 +1535,7 @@ def resample(
             If None, the window is calculated automatically from `new_shape`.
         interp_order (int|None): Order of the spline interpolation.
             0: nearest. Accepted range: [0, 5].
+            If None, uses Fourier interpolation. See `zoom()` for more info.
         extra_dim (bool): Force extra dimensions in the zoom parameters.
         fill_dim (bool): Dimensions not specified are left untouched.
 
@@ -1365,6 +1552,48 @@ def resample(
     return arr
 
 
+# ======================================================================
+def multi_resample_prepare(
+        shapes,
+        new_shape=None,
+        lossless=False,
+        window=None,
+        interp_order=0):
+    """
+    Prepare the parameters for resampling arrays to match the same shape.
+
+    Args:
+        shapes (iterable[iterable[int]]): The shapes of the input arrays.
+        new_shape (iterable[int]|None): The new base shape of the arrays.
+            If None, it is computed from `shapes` using `common_shape()`.
+        lossless (bool): allow for lossy resampling.
+        window (int|iterable[int]|None): Uniform pre-filter window size.
+        interp_order (int|None): Order of the spline interpolation.
+
+    Returns:
+        result (tuple): The tuple
+            contains:
+             - new_shape (tuple[int]): The new base shape of the arrays.
+             - window (int|iterable[int]|None): The pre-filter window size.
+             - interp_order (int|None): The order of the interpolation.
+
+    Examples:
+        >>> multi_resample_prepare([(2, 3), (3, 2)])
+        ((3, 3), None, 0)
+        >>> multi_resample_prepare([(2, 3), (3, 2)], None, True, 3, 1)
+        ((6, 6), None, 0)
+    """
+    if new_shape is None:
+        combiner = mrt.utils.lcm if lossless else max
+        new_shape = common_shape(shapes, combiner)
+    else:
+        new_shape = tuple(new_shape)
+    if lossless:
+        interp_order = 0
+        window = None
+    return new_shape, window, interp_order
+
+
 # ======================================================================
 def multi_resample(
         arrs,
@@ -1395,6 +1624,7 @@ def multi_resample(
             If None, the window is calculated automatically from `new_shape`.
         interp_order (int|None): Order of the spline interpolation.
             0: nearest. Accepted range: [0, 5].
+            If None, uses Fourier interpolation. See `zoom()` for more info.
         extra_dim (bool): Force extra dimensions in the zoom parameters.
         fill_dim (bool): Dimensions not specified are left untouched.
         dtype (data-type): Desired output data-type.
@@ -1406,33 +1636,14 @@ def multi_resample(
             It contains all reshaped arrays from `arrs`, through the last dim.
             The shape of this array is `new_shape` + `len(arrs)`.
     """
-    # calculate new shape
-    if new_shape is None:
-        shapes = [arr.shape for arr in arrs]
-        new_shape = [1] * max([len(shape) for shape in shapes])
-        shape_arr = np.ones((len(shapes), len(new_shape))).astype(np.int)
-        for i, shape in enumerate(shapes):
-            shape_arr[i, :len(shape)] = np.array(shape)
-        combiner = mrt.utils.lcm if lossless else max
-        new_shape = tuple(
-            combiner(*list(shape_arr[:, i]))
-            for i in range(len(new_shape)))
-    else:
-        new_shape = tuple(new_shape)
-
-    # resample images
-    if lossless:
-        interp_order = 0
-        window = None
+    new_shape, window, interp_order = multi_resample_prepare(
+        [arr.shape for arr in arrs], new_shape, lossless, window,
+        interp_order)
 
     if dtype is None:
-        # dtype = functools.reduce(
-        #     (lambda x, y: np.promote_types(x, y.dtype)), arrs)
-        dtype = bool
-        for arr in arrs:
-            dtype = np.promote_types(dtype, arr.dtype)
+        dtype = common_dtype([arr.dtype for arr in arrs])
 
-    result = np.array(new_shape + (len(arrs),), dtype=dtype)
+    result = np.zeros(new_shape + (len(arrs),), dtype=dtype)
     for i, arr in enumerate(arrs):
         # ratio should not be kept: keep_ratio_method=None
         result[..., i] = resample(
@@ -16,23 +16,26 @@ from __future__ import (
 # ======================================================================
 # :: Python Standard Library Imports
 import os  # Miscellaneous operating system interfaces
-# import shutil  # High-level file operations
+import shutil  # High-level file operations
 # import math  # Mathematical functions
 # import time  # Time access and conversions
 # import datetime  # Basic date and time types
 # import operator  # Standard operators as functions
 # import collections  # Container datatypes
-# import itertools  # Functions creating iterators for efficient looping
-# import functools  # Higher-order functions and operations on callable objects
+import functools  # Higher-order functions and operations on callable objects
 # import argparse  # Parser for command-line options, arguments and subcommands
 # import subprocess  # Subprocess management
 # import multiprocessing  # Process-based parallelism
 # import fractions  # Rational numbers
 # import csv  # CSV File Reading and Writing [CSV: Comma-Separated Values]
 # import json  # JSON encoder and decoder [JSON: JavaScript Object Notation]
-# import inspect  # Inspect live objects
+import inspect  # Inspect live objects
 # import unittest  # Unit testing framework
 import doctest  # Test interactive Python examples
+import concurrent.futures  # Launching parallel tasks
+import gzip  # Support for gzip files
+import tempfile  # Generate temporary files and directories
+import itertools  # Functions creating iterators for efficient looping
 
 # :: External Imports
 import numpy as np  # NumPy (multidimensional numerical arrays library)
@@ -67,20 +70,135 @@ from pymrt import msg, dbg
 # ======================================================================
 # :: Custom defined constants
 
+# :: maximum number of threads used for loading / saving multiple images
+# the I/O and the (de)compression do not hold the GIL, so threads overlap well
+# set to 1 to load / save sequentially
+_MAX_IO_WORKERS = 8
+
+# :: executor and pending tasks for the background compression of saved images
+_SAVE_EXECUTOR = None
+_SAVE_FUTURES = []
+
+# :: default affine transformation used when saving images (read-only)
+_DEFAULT_AFFINE = np.eye(4)
+_DEFAULT_AFFINE.flags.writeable = False
+
+# :: approximate size in bytes of the slabs used for out-of-core processing
+_SLAB_BYTES = 64 * 2 ** 20
+
 # ======================================================================
 # :: Default values usable in functions
 
 
+# ======================================================================
+@functools.lru_cache(maxsize=8)
+def _load_obj(
+        in_filepath,
+        mtime):
+    """
+    Load a NiBabel-supported image object without reading its data.
+
+    The result is cached, so that the same file is not parsed again when
+    it is used multiple times (e.g. across different filters).
+
+    Where supported, the file is kept open, so that consecutive slab-wise
+    reads of a compressed image (see `_slabs()`) continue from the current
+    position instead of decompressing the file again from the start.
+
+    Args:
+        in_filepath (str): The input file path.
+        mtime (float): The modification time of the input file.
+            This is only used to invalidate the cache if the file changes.
+
+    Returns:
+        obj (nib.spatialimages.SpatialImage): The NiBabel image object.
+    """
+    try:
+        return nib.load(in_filepath, keep_file_open=True)
+    except TypeError:  # the image type does not support `keep_file_open`
+        return nib.load(in_filepath)
+
+
+# ======================================================================
+def _roi_slicer(
+        roi,
+        shape):
+    """
+    Convert a region of interest into indices for the NiBabel image slicer.
+
+    The image slicer does not accept scalar indices in the spatial
+    dimensions, and it does not adjust the affine correctly for negative
+    indices. Hence, scalar indices are converted to singleton slices,
+    and negative indices are converted to the equivalent positive ones.
+    An `Ellipsis` is expanded to the corresponding full slices.
+
+    Args:
+        roi (tuple[slice|int]|slice|int): Region of interest.
+        shape (iterable[int]): The shape of the array.
+
+    Returns:
+        result (tuple): The tuple
+            contains:
+             - slicer (tuple[slice]): The indices for the image slicer.
+             - scalars (tuple[int]): The axes indexed by a scalar.
+               These must be removed from the result of the slicer.
+
+    Raises:
+        IndexError: If a scalar index is out of range, or if the region of
+            interest contains more than one `Ellipsis`.
+
+    Examples:
+        >>> _roi_slicer((1, slice(None)), (10, 20))
+        ((slice(1, 2, None), slice(0, 20, 1)), (0,))
+        >>> _roi_slicer((Ellipsis, -1), (10, 20))
+        ((slice(0, 10, 1), slice(19, 20, None)), (1,))
+        >>> _roi_slicer((100,), (10, 20))
+        Traceback (most recent call last):
+            ...
+        IndexError: index 100 is out of bounds for axis 0 with size 10
+    """
+    shape = tuple(shape)
+    roi = roi if isinstance(roi, tuple) else (roi,)
+    num_ellipsis = sum(index is Ellipsis for index in roi)
+    if num_ellipsis > 1:
+        raise IndexError('an index can only have a single ellipsis (...)')
+    elif num_ellipsis == 1:
+        i = [index is Ellipsis for index in roi].index(True)
+        roi = roi[:i] + (slice(None),) * (len(shape) - len(roi) + 1) + \
+            roi[i + 1:]
+    slicer = []
+    scalars = []
+    for i, (index, dim) in enumerate(zip(roi, shape)):
+        if isinstance(index, (int, np.integer)):
+            if not -dim <= index < dim:
+                raise IndexError(
+                    'index {} is out of bounds for axis {} with size {}'
+                    .format(index, i, dim))
+            index = int(index) % dim
+            slicer.append(slice(index, index + 1))
+            scalars.append(i)
+        elif isinstance(index, slice) and (index.step or 1) > 0:
+            slicer.append(slice(*index.indices(dim)))
+        else:
+            slicer.append(index)
+    return tuple(slicer), tuple(scalars)
+
+
 # ======================================================================
 def load(
         in_filepath,
-        meta=False):
+        meta=False,
+        roi=None):
     """
     Load a NiBabel-supported image.
 
     Args:
         in_filepath (str): The input file path.
         meta (bool): Include metadata.
+        roi (tuple[slice]|slice|None): Region of interest to load.
+            If None, the whole array is loaded.
+            Otherwise, only the data within the region is read from disk,
+            and the metadata (e.g. the affine) refers to the region.
 
     Returns:
         arr (np.ndarray): The array data.
@@ -88,26 +206,343 @@ def load(
             This is only produced if `meta` is True.
 
     See Also:
-        nibabel.load, nibabel.get_data, nibabel.get_affine, nibabel.get_header
-    """
-    obj = nib.load(in_filepath)
-    arr = obj.get_data()
+        nibabel.load, nibabel.dataobj, nibabel.affine, nibabel.header,
+        nibabel.slicer
+    """
+    obj = _load_obj(in_filepath, os.path.getmtime(in_filepath))
+    if roi is not None:
+        slicer, scalars = _roi_slicer(roi, obj.shape)
+        # the sub-image affine is translated to the origin of the region
+        obj = obj.slicer[slicer]
+    arr = np.asanyarray(obj.dataobj)
+    if roi is not None and scalars:
+        arr = arr.reshape(
+            [dim for i, dim in enumerate(arr.shape) if i not in scalars])
     if meta:
         # todo: polishing
+        # copies, so that the cached image cannot be modified through them
         meta = dict(
-            affine=obj.get_affine(),
-            header=obj.get_header())
+            affine=obj.affine.copy(),
+            header=obj.header.copy())
         return arr, meta
     else:
         return arr
 
 
+# ======================================================================
+def _slabs(
+        shape,
+        itemsize,
+        max_bytes=None,
+        axis=-1):
+    """
+    Generate the indices of the slabs covering an array of a given shape.
+
+    By default, the slabs are taken along the last axis, because the NIfTI
+    data is stored in column-major order, and hence each slab is contiguous
+    on disk.
+
+    Args:
+        shape (iterable[int]): The shape of the array.
+        itemsize (int): The size in bytes of each element of the array.
+        max_bytes (int|None): The maximum size in bytes of each slab.
+            If None, uses `_SLAB_BYTES`.
+            Each slab contains at least one index along `axis`.
+        axis (int): The axis along which the slabs are taken.
+
+    Yields:
+        slab (tuple[slice]): The indices of the slab.
+    """
+    if max_bytes is None:
+        max_bytes = _SLAB_BYTES
+    axis = axis % len(shape)
+    slab_bytes = itemsize * int(
+        np.prod([dim for i, dim in enumerate(shape) if i != axis]))
+    step = max(1, max_bytes // max(1, slab_bytes))
+    for i in range(0, shape[axis], step):
+        yield (slice(None),) * axis + (slice(i, i + step),)
+
+
+# ======================================================================
+def _masked_slabs(
+        arr,
+        mask,
+        dtype=None,
+        max_bytes=None):
+    """
+    Generate the values of an array within a mask, reading both by slabs.
+
+    The slabs are taken along the last axis (see `_slabs()`).
+    If the mask has fewer dimensions than the array, it is applied to the
+    leading axes of the array (as for boolean indexing), and it is read only
+    once.
+
+    Args:
+        arr (np.ndarray|nib.arrayproxy.ArrayProxy): The input array.
+        mask (np.ndarray|nib.arrayproxy.ArrayProxy): The mask array.
+            Its shape must match the leading axes of the shape of `arr`.
+        dtype (data-type|None): The data-type of the values.
+            If None, the data-type of the (scaled) data is used.
+        max_bytes (int|None): The maximum size in bytes of each slab.
+            If None, uses `_SLAB_BYTES`.
+
+    Yields:
+        values (np.ndarray): The 1D array of the values within the mask
+            for each slab.
+    """
+    mask_ndim = len(mask.shape)
+    if mask_ndim < len(arr.shape):
+        mask = np.asarray(mask, dtype=bool)
+    itemsize = np.dtype(np.float64 if dtype is None else dtype).itemsize
+    for slab in _slabs(arr.shape, itemsize, max_bytes):
+        values = np.asarray(arr[slab], dtype=dtype)
+        yield values[np.asarray(mask[slab[:mask_ndim]], dtype=bool)].ravel()
+
+
+# ======================================================================
+def _masked_values(
+        arr,
+        mask,
+        dtype=None):
+    """
+    Extract the values of an array within a mask, reading both by slabs.
+
+    This gives the same values as `np.asarray(arr, dtype)[mask]`, but it
+    never holds the full data in memory, only one slab at a time (and the
+    same holds for the mask, unless it is given as an in-memory array).
+
+    The slabs are taken along the last axis (contiguous on disk), hence the
+    order of the values differs from that of boolean indexing.
+    However, it only depends on the shape and on `dtype`, so that the values
+    extracted from arrays of the same shape are still paired.
+
+    Args:
+        arr (np.ndarray|nib.arrayproxy.ArrayProxy): The input array.
+        mask (np.ndarray|nib.arrayproxy.ArrayProxy): The mask array.
+            Its shape must match the leading axes of the shape of `arr`.
+        dtype (data-type|None): The data-type of the values.
+            If None, the data-type of the (scaled) data is used.
+
+    Returns:
+        values (np.ndarray): The 1D array of the values within the mask.
+
+    Examples:
+        >>> arr = np.arange(24).reshape((2, 3, 4))
+        >>> mask = arr % 3 == 0
+        >>> values = _masked_values(arr, mask)
+        >>> np.array_equal(np.sort(values), np.sort(arr[mask]))
+        True
+        >>> mask = mask[..., 0]
+        >>> values = _masked_values(arr, mask, np.float64)
+        >>> np.array_equal(np.sort(values), np.sort(arr[mask].ravel()))
+        True
+        >>> values.dtype
+        dtype('float64')
+    """
+    values = list(_masked_slabs(arr, mask, dtype))
+    return np.concatenate(values) if values else np.empty(0, dtype=dtype)
+
+
+# ======================================================================
+def _load_multi(
+        in_filepaths,
+        max_workers=None):
+    """
+    Load multiple NiBabel-supported images, including their metadata.
+
+    The images are loaded concurrently using a pool of threads.
+    The order of the input is preserved.
+
+    Args:
+        in_filepaths (iterable[str]): List of input file paths.
+        max_workers (int|None): Maximum number of concurrent loads.
+            If None, uses `_MAX_IO_WORKERS`.
+            If smaller than 2, the images are loaded sequentially.
+
+    Returns:
+        result (tuple): The tuple
+            contains:
+             - arrs (list[np.ndarray]): The array data.
+             - metas (list[dict]): The metadata information.
+    """
+    in_filepaths = list(in_filepaths)
+    if max_workers is None:
+        max_workers = _MAX_IO_WORKERS
+    max_workers = min(max_workers, len(in_filepaths))
+    if max_workers > 1:
+        with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+            pairs = list(executor.map(
+                lambda x: load(x, meta=True), in_filepaths))
+    else:
+        pairs = [load(in_filepath, meta=True) for in_filepath in in_filepaths]
+    arrs = [arr for arr, meta in pairs]
+    metas = [meta for arr, meta in pairs]
+    return arrs, metas
+
+
+# ======================================================================
+def _filter_one(
+        in_filepath,
+        func,
+        *args):
+    """
+    Load a single image and apply a filtering function to its data.
+
+    This is defined at the module level so that it can be sent to other
+    processes (see `_filter_multi()`).
+
+    Args:
+        in_filepath (str): The input file path.
+        func (callable): Filtering function (arr: ndarray)
+            func(arr, *args) -> arr
+            Must be picklable (e.g. defined at the module level).
+        *args (tuple): Positional arguments passed to the filtering function.
+
+    Returns:
+        arr (np.ndarray): The filtered array.
+    """
+    return func(load(in_filepath), *args)
+
+
+# ======================================================================
+def _filter_multi(
+        in_filepaths,
+        func,
+        *args,
+        n_jobs=None):
+    """
+    Apply a filtering function independently to each of multiple images.
+
+    The images are processed concurrently using a pool of processes, since
+    most filtering functions (e.g. `scipy.ndimage.zoom()`) hold the GIL.
+    The order of the input is preserved.
+
+    Args:
+        in_filepaths (iterable[str]): List of input file paths.
+        func (callable): Filtering function (arr: ndarray)
+            func(arr, *args) -> arr
+            Must be picklable (e.g. defined at the module level).
+        *args (tuple): Positional arguments passed to the filtering function.
+            These are the same for all images.
+        n_jobs (int|None): Maximum number of concurrent processes.
+            If None, uses the number of CPUs.
+            If smaller than 2, the images are processed sequentially.
+
+    Returns:
+        arrs (list[np.ndarray]): The filtered arrays.
+    """
+    in_filepaths = list(in_filepaths)
+    if n_jobs is None:
+        n_jobs = os.cpu_count() or 1
+    n_jobs = min(n_jobs, len(in_filepaths))
+    if n_jobs > 1:
+        with concurrent.futures.ProcessPoolExecutor(n_jobs) as executor:
+            arrs = list(executor.map(
+                _filter_one, in_filepaths, itertools.repeat(func),
+                *[itertools.repeat(arg) for arg in args]))
+    else:
+        arrs = [
+            _filter_one(in_filepath, func, *args)
+            for in_filepath in in_filepaths]
+    return arrs
+
+
+# ======================================================================
+def _compress(
+        in_filepath,
+        out_filepath,
+        compresslevel=1):
+    """
+    Compress a file with gzip, replacing the output atomically.
+
+    The input file is removed afterwards, even if the compression fails
+    (in which case, the partial output is removed as well).
+
+    Args:
+        in_filepath (str): The uncompressed input file path.
+        out_filepath (str): The compressed output file path.
+        compresslevel (int): The gzip compression level.
+            The default matches the one used by NiBabel.
+
+    Returns:
+        None.
+    """
+    tmp_filepath = out_filepath + '.part'
+    try:
+        with open(in_filepath, 'rb') as in_file, \
+                gzip.open(tmp_filepath, 'wb', compresslevel) as out_file:
+            shutil.copyfileobj(in_file, out_file)
+        os.replace(tmp_filepath, out_filepath)
+    finally:
+        for filepath in (tmp_filepath, in_filepath):
+            if os.path.isfile(filepath):
+                os.remove(filepath)
+
+
+# ======================================================================
+def wait_saves():
+    """
+    Wait for the completion of all the images saved in the background.
+
+    Returns:
+        None.
+
+    Raises:
+        Exception: The first exception raised during a background save.
+            This is only raised after all the pending saves have completed.
+
+    See Also:
+        save()
+    """
+    global _SAVE_FUTURES
+    futures, _SAVE_FUTURES = _SAVE_FUTURES, []
+    concurrent.futures.wait(futures)
+    for future in futures:
+        future.result()
+
+
+# ======================================================================
+def _prepare_nifti1(
+        arr,
+        kwargs):
+    """
+    Prepare data and parameters for saving a NIfTI-1 image.
+
+    Args:
+        arr (np.ndarray): Data to be stored.
+        kwargs (dict): Keyword arguments for `nib.Nifti1Image`.
+            This is modified in-place.
+
+    Returns:
+        arr (np.ndarray): Data to be stored, in a NIfTI-1 compatible format.
+    """
+    if np.issubdtype(arr.dtype, np.bool_):
+        arr = arr.view(np.uint8)
+    elif np.issubdtype(arr.dtype, np.floating):
+        np.nan_to_num(
+            arr, copy=False, nan=0.0, posinf=np.inf, neginf=-np.inf)
+    if 'affine' not in kwargs:
+        kwargs['affine'] = _DEFAULT_AFFINE
+    if 'header' in kwargs:
+        kwargs['header'] = None
+    if '_header' in kwargs:
+        kwargs['header'] = kwargs.pop('_header')
+    return arr
+
+
+# :: functions preparing the data for saving, for each NiBabel class
+_SAVE_PREPARERS = {
+    nib.Nifti1Image: _prepare_nifti1,
+}
+
+
 # ======================================================================
 def save(
         out_filepath,
         arr,
         img_type=nib.Nifti1Image,
         *args,
+        background=False,
         **kwargs):
     """
     Save a NiBabel-supported image.
@@ -116,25 +551,47 @@ def save(
         out_filepath (str): Output file path.
         arr (np.ndarray): Data to be stored.
         img_type: The NiBabel class to use for saving.
+        background (bool): Compress the output in the background.
+            This only affects gzip-compressed outputs (e.g. `.nii.gz`).
+            If True, the image is written uncompressed to a temporary file
+            in the output directory and the gzip compression is performed
+            by a pool of threads, so that it overlaps with the caller.
+            The output file only appears when its compression is complete.
+            Use `wait_saves()` to wait for all pending saves.
 
     Returns:
-        None.
+        future (concurrent.futures.Future|None): The compression task.
+            This is only produced if the compression runs in the background.
+
+    See Also:
+        wait_saves()
     """
-    if img_type == nib.Nifti1Image:
-        if arr.dtype == bool:
-            arr = arr.astype(int)
-        if arr.dtype == float:
-            mask = np.isnan(arr)
-            arr[mask] = 0.0
-        if 'affine' not in kwargs:
-            kwargs['affine'] = np.eye(4)
-        if 'header' in kwargs:
-            kwargs['header'] = None
-        if '_header' in kwargs:
-            kwargs['header'] = kwargs['_header']
-            kwargs.pop('_header')
+    global _SAVE_EXECUTOR
+    if img_type in _SAVE_PREPARERS:
+        arr = _SAVE_PREPARERS[img_type](arr, kwargs)
     obj = img_type(arr, *(args if args else ()), **(kwargs if kwargs else {}))
-    obj.to_filename(out_filepath)
+    gz_ext = mrt.utils.add_extsep(mrt.utils.EXT['gzip'])
+    if background and out_filepath.endswith(gz_ext):
+        tmp_fd, tmp_filepath = tempfile.mkstemp(
+            suffix=os.path.basename(out_filepath)[:-len(gz_ext)],
+            dir=os.path.dirname(os.path.abspath(out_filepath)))
+        os.close(tmp_fd)
+        try:
+            obj.to_filename(tmp_filepath)
+        except BaseException:
+            os.remove(tmp_filepath)
+            raise
+        if _SAVE_EXECUTOR is None:
+            _SAVE_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+                os.cpu_count())
+        future = _SAVE_EXECUTOR.submit(_compress, tmp_filepath, out_filepath)
+        # forget the completed saves, except the failed ones
+        _SAVE_FUTURES[:] = [
+            x for x in _SAVE_FUTURES if not x.done() or x.exception()]
+        _SAVE_FUTURES.append(future)
+        return future
+    else:
+        obj.to_filename(out_filepath)
 
 
 # ======================================================================
@@ -156,9 +613,8 @@ def masking(
         None.
     """
     arr, meta = load(in_filepath, meta=True)
-    mask = load(mask_filepath).astype(bool)
-    arr[~mask] = mask_val
-    save(out_filepath, arr, **{k: v for k, v in meta.items()})
+    arr[load(mask_filepath) == 0] = mask_val
+    save(out_filepath, arr, **meta)
 
 
 # ======================================================================
@@ -167,6 +623,7 @@ def filter_1_1(
         out_filepath,
         func,
         *args,
+        roi=None,
         **kwargs):
     """
     Interface to generic 1-1 filter.
@@ -183,14 +640,16 @@ def filter_1_1(
             (arr: ndarray, aff:ndarray, hdr:header).
             func(arr, aff, hdr, *args, *kwargs) -> arr, aff, hdr.
         *args (tuple): Positional arguments passed to the filtering function.
+        roi (tuple[slice]|slice|None): Region of interest of the input.
+            See `load()` for more info.
         **kwargs (dict): Keyword arguments passed to the filtering function.
 
     Returns:
         None
     """
-    arr, meta = load(in_filepath, meta=True)
+    arr, meta = load(in_filepath, meta=True, roi=roi)
     arr, meta = func(arr, meta, *args, **kwargs)
-    save(out_filepath, arr, **{k: v for k, v in meta.items()})
+    save(out_filepath, arr, **meta)
 
 
 # ======================================================================
@@ -221,13 +680,9 @@ def filter_n_1(
     Returns:
         None
     """
-    arrs, metas = [], []
-    for in_filepath in in_filepaths:
-        arr, meta = load(in_filepath, meta=True)
-        arrs.append(arr)
-        metas.append(meta)
+    arrs, metas = _load_multi(in_filepaths)
     arr, meta = func(arrs, metas, *args, **kwargs)
-    save(out_filepath, arr, **{k: v for k, v in meta.items()})
+    save(out_filepath, arr, **meta)
 
 
 # ======================================================================
@@ -258,14 +713,11 @@ def filter_n_m(
     Returns:
         None.
     """
-    arrs, metas = [], []
-    for in_filepath in in_filepaths:
-        arr, meta = load(in_filepath, meta=True)
-        arrs.append(arr)
-        metas.append(meta)
+    arrs, metas = _load_multi(in_filepaths)
     output_list = func(arrs, metas, *args, **kwargs)
     for (arr, meta), out_filepath in zip(output_list, out_filepaths):
-        save(out_filepath, arr, **{k: v for k, v in meta.items()})
+        save(out_filepath, arr, background=True, **meta)
+    wait_saves()
 
 
 # ======================================================================
@@ -300,12 +752,63 @@ def filter_n_x(
     pass
 
 
+# ======================================================================
+def _filter_slabs(
+        arr,
+        out_file,
+        func,
+        *args,
+        **kwargs):
+    """
+    Apply a slab-local filtering function, reading and filtering in parallel.
+
+    While a slab is being filtered, the next one is read in the background.
+
+    Args:
+        arr (np.ndarray|nib.arrayproxy.ArrayProxy): The input array.
+        out_file (file): The file object backing the output array.
+            Must be opened in binary read/write mode.
+        func (callable): Filtering function (arr: np.ndarray)
+            func(arr, *args, *kwargs) -> arr
+            The output must have the same shape as the input.
+        *args (*tuple): Positional arguments passed to the filtering function
+        **kwargs (**dict): Keyword arguments passed to the filtering function
+
+    Returns:
+        result (np.memmap): The filtered array.
+
+    Raises:
+        ValueError: If the filtering function changes the shape of a slab.
+    """
+    slabs = list(_slabs(arr.shape, np.dtype(np.float64).itemsize))
+    result = None
+    with concurrent.futures.ThreadPoolExecutor(1) as executor:
+        loading = executor.submit(lambda x: np.asanyarray(arr[x]), slabs[0])
+        for i, slab in enumerate(slabs):
+            data = loading.result()
+            if i + 1 < len(slabs):
+                loading = executor.submit(
+                    lambda x: np.asanyarray(arr[x]), slabs[i + 1])
+            data = func(data, *args, **kwargs)
+            if data.shape != np.broadcast_to(0, arr.shape)[slab].shape:
+                raise ValueError('filtering function must preserve shape')
+            if result is None:
+                # column-major, so that the slabs are contiguous, as on disk
+                result = np.memmap(
+                    out_file, dtype=data.dtype, mode='w+', shape=arr.shape,
+                    order='F')
+            result[slab] = data
+    return result
+
+
 # ======================================================================
 def simple_filter_1_1(
         in_filepath,
         out_filepath,
         func,
         *args,
+        roi=None,
+        slab_local=False,
         **kwargs):
     """
     Interface to simplified 1-1 filter.
@@ -319,14 +822,31 @@ def simple_filter_1_1(
         func (callable): Filtering function (arr: np.ndarray)
             func(arr, *args, *kwargs) -> arr
         *args (*tuple): Positional arguments passed to the filtering function
+        roi (tuple[slice]|slice|None): Region of interest of the input.
+            See `load()` for more info.
+        slab_local (bool): Apply the filtering function by slabs.
+            This is only correct if each output value depends only on the
+            input value at the same position (e.g. thresholding), so that
+            the result of a slab is the same shape as the slab itself.
+            The next slab is read while the current one is filtered, and
+            the result is gathered into a memory-mapped temporary file.
+            This is ignored if `roi` is not None.
         **kwargs (**dict): Keyword arguments passed to the filtering function
 
     Returns:
         None
     """
-    arr, meta = load(in_filepath, meta=True)
-    arr = func(arr, *args, **kwargs)
-    save(out_filepath, arr, **{k: v for k, v in meta.items()})
+    if slab_local and roi is None:
+        obj = _load_obj(in_filepath, os.path.getmtime(in_filepath))
+        out_dirpath = os.path.dirname(os.path.abspath(out_filepath))
+        with tempfile.TemporaryFile(dir=out_dirpath) as tmp_file:
+            arr = _filter_slabs(
+                obj.dataobj, tmp_file, func, *args, **kwargs)
+            save(out_filepath, arr, affine=obj.affine, header=obj.header)
+    else:
+        arr, meta = load(in_filepath, meta=True, roi=roi)
+        arr = func(arr, *args, **kwargs)
+        save(out_filepath, arr, **meta)
 
 
 # ======================================================================
@@ -353,14 +873,10 @@ def simple_filter_n_1(
     Returns:
         None.
     """
-    arrs, metas = [], []
-    for in_filepath in in_filepaths:
-        arr, meta = load(in_filepath, meta=True)
-        arrs.append(arr)
-        metas.append(meta)
+    arrs, metas = _load_multi(in_filepaths)
     arr = func(arrs, *args, **kwargs)
     meta = metas[-1]  # the metadata of the first image
-    save(out_filepath, arr, **{k: v for k, v in meta.items()})
+    save(out_filepath, arr, **meta)
 
 
 # ======================================================================
@@ -391,14 +907,10 @@ def simple_filter_nn_1(
     Returns:
         None.
     """
-    arrs, metas = [], []
-    for in_filepath in in_filepaths:
-        arr, meta = load(in_filepath, meta=True)
-        arrs.append(arr)
-        metas.append(meta)
+    arrs, metas = _load_multi(in_filepaths)
     arr = func(*(arrs + list(args)), **kwargs)
     meta = metas[-1]  # the affine of the last image
-    save(out_filepath, arr, **{k: v for k, v in meta.items()})
+    save(out_filepath, arr, **meta)
 
 
 # ======================================================================
@@ -427,7 +939,8 @@ def simple_filter_1_m(
     arr, meta = load(in_filepath, meta=True)
     o_arrs = func(arr, *args, **kwargs)
     for arr, out_filepath in zip(o_arrs, out_filepaths):
-        save(out_filepath, arr, **{k: v for k, v in meta.items()})
+        save(out_filepath, arr, background=True, **meta)
+    wait_saves()
 
 
 # ======================================================================
@@ -453,15 +966,12 @@ def simple_filter_n_m(
     Returns:
         None.
     """
-    i_arrs, metas = [], []
-    for in_filepath in in_filepaths:
-        arr, meta = load(in_filepath, meta=True)
-        i_arrs.append(arr)
-        metas.append(meta)
+    i_arrs, metas = _load_multi(in_filepaths)
     o_arrs = func(i_arrs, *args, **kwargs)
     meta = metas[-1]  # the affine of the last image
     for arr, out_filepath in zip(o_arrs, out_filepaths):
-        save(out_filepath, arr, **{k: v for k, v in meta.items()})
+        save(out_filepath, arr, background=True, **meta)
+    wait_saves()
 
 
 # ======================================================================
@@ -491,15 +1001,12 @@ def simple_filter_nn_m(
     Returns:
         None.
     """
-    i_arrs, metas = [], []
-    for in_filepath in in_filepaths:
-        arr, meta = load(in_filepath, meta=True)
-        i_arrs.append(arr)
-        metas.append(meta)
+    i_arrs, metas = _load_multi(in_filepaths)
     o_arrs = func(*(i_arrs + list(args)), **kwargs)
     meta = metas[-1]  # the affine of the last image
     for arr, out_filepath in zip(o_arrs, out_filepaths):
-        save(out_filepath, arr, **{k: v for k, v in meta.items()})
+        save(out_filepath, arr, background=True, **meta)
+    wait_saves()
 
 
 # ======================================================================
@@ -544,7 +1051,8 @@ def simple_filter_1_x(
         out_dirpath = os.path.dirname(out_filepath)
         if not os.path.isdir(out_dirpath):
             os.makedirs(out_dirpath)
-        save(out_filepath, arr, **{k: v for k, v in meta.items()})
+        save(out_filepath, arr, background=True, **meta)
+    wait_saves()
 
 
 # ======================================================================
@@ -653,17 +1161,26 @@ def split(
     out_filepaths = []
 
     arr, meta = load(in_filepath, meta=True)
-    # split data
-    arrs = np.split(arr, arr.shape[axis], axis)
-    # save data to output
-    for i, image in enumerate(arrs):
+    # split data (as views, keeping the split axis as a singleton)
+    arrs = [
+        np.expand_dims(image, axis) for image in np.moveaxis(arr, axis, 0)]
+    for i in range(len(arrs)):
         i_str = str(i).zfill(len(str(len(arrs))))
         out_filepath = os.path.join(
             out_dirpath,
             mrt.utils.change_ext(out_basename + '-' + i_str,
                                  mrt.utils.EXT['niz'], ''))
-        save(out_filepath, image, **{k: v for k, v in meta.items()})
         out_filepaths.append(out_filepath)
+    # save data to output (concurrently, compression does not hold the GIL)
+    max_workers = min(_MAX_IO_WORKERS, len(arrs))
+    if max_workers > 1:
+        with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+            list(executor.map(
+                lambda x, y: save(x, y, **meta),
+                out_filepaths, arrs))
+    else:
+        for out_filepath, image in zip(out_filepaths, arrs):
+            save(out_filepath, image, **meta)
     return out_filepaths
 
 
@@ -673,7 +1190,8 @@ def frame(
         out_filepath,
         borders,
         background=0,
-        use_longest=True):
+        use_longest=True,
+        roi=None):
     """
     Add a border frame to the image (same resolution / voxel size)
 
@@ -689,13 +1207,16 @@ def frame(
             calculations.
         background (int|float): The background value to be used for the frame.
         use_longest (bool): Use longest dimension to get the border size.
+        roi (tuple[slice]|slice|None): Region of interest of the input.
+            If None, the whole input is used.
+            Otherwise, only this region is loaded and framed.
 
     Returns:
         None
     """
     simple_filter_1_1(
         in_filepath, out_filepath, mrt.geometry.frame,
-        borders, background, use_longest)
+        borders, background, use_longest, roi=roi)
 
 
 # ======================================================================
@@ -731,7 +1252,8 @@ def multi_reframe(
         out_filepath,
         new_shape=None,
         background=0.0,
-        dtype=None):
+        dtype=None,
+        n_jobs=None):
     """
     Reframe arrays (by adding border) to match the same shape.
 
@@ -739,6 +1261,7 @@ def multi_reframe(
         - uses 'reframe' under the hood
         - the sampling / resolution / voxel size will NOT change
         - the support space / field-of-view will change
+        - the images are reframed concurrently in separate processes
 
     Args:
         in_filepaths (iterable[str]): List of input file paths.
@@ -748,14 +1271,25 @@ def multi_reframe(
         dtype (data-type): Desired output data-type.
             If None, its guessed from dtype of arrs.
             See `np.ndarray()` for more.
+        n_jobs (int|None): Maximum number of concurrent processes.
+            If None, uses the number of CPUs.
+            If 1, the images are reframed sequentially.
 
     Returns:
         None
     """
-    simple_filter_n_1(
-        in_filepaths, out_filepath,
-        mrt.geometry.multi_reframe,
-        new_shape=new_shape, background=background, dtype=dtype)
+    in_filepaths = list(in_filepaths)
+    objs = [_load_obj(x, os.path.getmtime(x)) for x in in_filepaths]
+    if new_shape is None:
+        new_shape = mrt.geometry.common_shape([obj.shape for obj in objs])
+    arrs = _filter_multi(
+        in_filepaths, mrt.geometry.reframe, tuple(new_shape), background,
+        n_jobs=n_jobs)
+    if dtype is None:
+        # the loaded data-types include the scaling, the on-disk ones do not
+        dtype = mrt.geometry.common_dtype([arr.dtype for arr in arrs])
+    arr = np.stack(arrs, axis=-1).astype(dtype, copy=False)
+    save(out_filepath, arr, affine=objs[-1].affine, header=objs[-1].header)
 
 
 # ======================================================================
@@ -785,8 +1319,10 @@ def zoom(
             If int, uses an isotropic window with the specified size.
             If None, the window is calculated automatically from the `zoom`
             parameter.
-        interp_order (int): Order of the spline interpolation.
+        interp_order (int|None): Order of the spline interpolation.
             0: nearest. Accepted range: [0, 5].
+            If None, uses Fourier interpolation.
+            See `geometry.zoom()` for more info.
         extra_dim (bool): Force extra dimensions in the zoom parameters.
         fill_dim (bool): Dimensions not specified are left untouched.
 
@@ -832,6 +1368,8 @@ def resample(
             If None, the window is calculated automatically from `new_shape`.
         interp_order (int|None): Order of the spline interpolation.
             0: nearest. Accepted range: [0, 5].
+            If None, uses Fourier interpolation.
+            See `geometry.zoom()` for more info.
         extra_dim (bool): Force extra dimensions in the zoom parameters.
         fill_dim (bool): Dimensions not specified are left untouched.
 
@@ -843,7 +1381,7 @@ def resample(
     """
     simple_filter_1_1(
         in_filepath, out_filepath, mrt.geometry.resample,
-        new_shape, aspect, window, extra_dim, fill_dim, interp_order)
+        new_shape, aspect, window, interp_order, extra_dim, fill_dim)
 
 
 # ======================================================================
@@ -856,14 +1394,16 @@ def multi_resample(
         interp_order=0,
         extra_dim=True,
         fill_dim=True,
-        dtype=None):
+        dtype=None,
+        n_jobs=None):
     """
     Resample arrays to match the same shape.
 
     Note that:
         - uses 'geometry.resample()' internally;
         - the sampling / resolution / voxel size will change;
-        - the support space / field-of-view will NOT change.
+        - the support space / field-of-view will NOT change;
+        - the images are resampled concurrently in separate processes.
 
     Args:
         in_filepaths (iterable[str]): List of input file paths.
@@ -878,21 +1418,33 @@ def multi_resample(
             If None, the window is calculated automatically from `new_shape`.
         interp_order (int|None): Order of the spline interpolation.
             0: nearest. Accepted range: [0, 5].
+            If None, uses Fourier interpolation.
+            See `geometry.zoom()` for more info.
         extra_dim (bool): Force extra dimensions in the zoom parameters.
         fill_dim (bool): Dimensions not specified are left untouched.
         dtype (data-type): Desired output data-type.
             If None, its guessed from dtype of arrs.
             See `np.ndarray()` for more.
+        n_jobs (int|None): Maximum number of concurrent processes.
+            If None, uses the number of CPUs.
+            If 1, the images are resampled sequentially.
 
     Returns:
         None
     """
-    simple_filter_n_1(
-        in_filepaths, out_filepath,
-        mrt.geometry.multi_resample,
-        new_shape=new_shape, lossless=lossless, window=window,
-        interp_order=interp_order, extra_dim=extra_dim, fill_dim=fill_dim,
-        dtype=dtype)
+    in_filepaths = list(in_filepaths)
+    objs = [_load_obj(x, os.path.getmtime(x)) for x in in_filepaths]
+    new_shape, window, interp_order = mrt.geometry.multi_resample_prepare(
+        [obj.shape for obj in objs], new_shape, lossless, window,
+        interp_order)
+    arrs = _filter_multi(
+        in_filepaths, mrt.geometry.resample, tuple(new_shape), None, window,
+        interp_order, extra_dim, fill_dim, n_jobs=n_jobs)
+    if dtype is None:
+        # the loaded data-types include the scaling, the on-disk ones do not
+        dtype = mrt.geometry.common_dtype([arr.dtype for arr in arrs])
+    arr = np.stack(arrs, axis=-1).astype(dtype, copy=False)
+    save(out_filepath, arr, affine=objs[-1].affine, header=objs[-1].header)
 
 
 # ======================================================================
@@ -928,9 +1480,81 @@ def mask_threshold(
     """
     kw_params = mrt.utils.set_keyword_parameters(
         mrt.segmentation.mask_threshold, locals())
+    # in absolute mode, each slab can be thresholded independently
     simple_filter_1_1(
         in_filepath, out_filepath, mrt.segmentation.mask_threshold,
-        **kw_params)
+        slab_local=kw_params['mode'] == 'absolute', **kw_params)
+
+
+# ======================================================================
+def _label_slabs(
+        arr,
+        labeled,
+        structure=None):
+    """
+    Label the contiguous objects of an array, processing it by slabs.
+
+    Each slab is labeled independently with `scipy.ndimage.label()`, then
+    objects touching across consecutive slabs are merged using union-find.
+    The slabs are taken along the last axis (contiguous on disk), hence the
+    labels are not in the same order as with `scipy.ndimage.label()`.
+
+    Args:
+        arr (np.ndarray|nib.arrayproxy.ArrayProxy): The input array.
+            The background is assumed to have a value of 0.
+        labeled (np.ndarray): The output array (e.g. a `np.memmap`).
+            Its shape must match the shape of `arr`.
+            Must have an integer data-type.
+        structure (ndarray|None): Definition of feature connections.
+            If None, use default.
+
+    Returns:
+        result (tuple): The tuple
+            contains:
+             - parents (np.ndarray[int]): The merged label of each label.
+               These are the smallest label of the corresponding object.
+             - num_labels (int): The number of labels in `labeled`.
+    """
+
+    def _find(x):
+        root = x
+        while parents[root] != root:
+            root = parents[root]
+        while parents[x] != root:
+            parents[x], x = root, parents[x]
+        return root
+
+    parents = np.zeros(1, dtype=labeled.dtype)
+    num_labels = 0
+    last = None
+    for slab in _slabs(arr.shape, labeled.itemsize):
+        tile, num = sp.ndimage.label(np.asanyarray(arr[slab]), structure)
+        np.add(tile, num_labels, out=tile, where=tile > 0)
+        parents = np.concatenate(
+            (parents, np.arange(num_labels + 1, num_labels + num + 1)))
+        if last is not None:
+            # label the slab boundary to find the objects touching across it
+            boundary = np.stack((last, tile[..., 0]), axis=-1)
+            joints, num_joints = sp.ndimage.label(boundary > 0, structure)
+            if num_joints:
+                pairs = np.unique(
+                    np.stack((joints, boundary)).reshape(2, -1)[
+                        :, joints.ravel() > 0], axis=1)
+                for i in range(1, pairs.shape[1]):
+                    if pairs[0, i] == pairs[0, i - 1]:
+                        root1 = _find(pairs[1, i - 1])
+                        root2 = _find(pairs[1, i])
+                        parents[max(root1, root2)] = min(root1, root2)
+        labeled[slab] = tile
+        last = tile[..., -1]
+        num_labels += num
+    # merged labels are always smaller: pointer jumping converges
+    while True:
+        roots = parents[parents]
+        if np.array_equal(roots, parents):
+            break
+        parents = roots
+    return parents, num_labels
 
 
 # ======================================================================
@@ -940,27 +1564,131 @@ def find_objects(
         structure=None,
         max_label=0):
     """
-    Extract labels using: `geometry.find_objects()`
+    Label the contiguous objects of an image.
+
+    The labels are sorted by decreasing object size (1 is the largest).
+    The image is labeled by slabs (see `_label_slabs()`) into a memory-mapped
+    temporary file, so that neither the input nor the labels are fully
+    loaded into memory.
 
     Args:
         in_filepath (str): The input file path
         out_filepath (str): The output file path
         structure (ndarray|None): The definition of the feature connections.
             If None, use default.
-        max_label (int): Limit the number of labels to search through.
+        max_label (int): Limit the number of labels.
+            Only the `max_label` largest objects are kept, the others are
+            set to the background.
+            If 0, all the objects are kept.
+
+    Returns:
+        None.
 
     See Also:
-        geometry.find_objects
+        segmentation.find_objects, scipy.ndimage.label
+    """
+    obj = _load_obj(in_filepath, os.path.getmtime(in_filepath))
+    out_dirpath = os.path.dirname(os.path.abspath(out_filepath))
+    with tempfile.TemporaryFile(dir=out_dirpath) as tmp_file:
+        # column-major, so that the slabs are contiguous, as on disk
+        labeled = np.memmap(
+            tmp_file, dtype=np.int32, mode='w+', shape=obj.shape, order='F')
+        parents, num_labels = _label_slabs(obj.dataobj, labeled, structure)
+        sizes = np.zeros(num_labels + 1, dtype=int)
+        for slab in _slabs(labeled.shape, labeled.itemsize):
+            sizes += np.bincount(
+                parents[labeled[slab]].ravel(), minlength=num_labels + 1)
+        objects = np.flatnonzero(parents == np.arange(num_labels + 1))[1:]
+        # on ties, keep the order of `scipy.ndimage.label()`, i.e. that of
+        # the first (C-order) position of each object
+        if len(np.unique(sizes[objects])) < len(objects):
+            firsts = np.full(num_labels + 1, labeled.size, dtype=int)
+            for slab in _slabs(labeled.shape, labeled.itemsize):
+                roots = parents[labeled[slab]]
+                values, indexes = np.unique(roots, return_index=True)
+                coords = np.unravel_index(indexes, roots.shape)
+                coords[-1][:] += slab[-1].start
+                firsts[values] = np.minimum(
+                    firsts[values],
+                    np.ravel_multi_index(coords, labeled.shape))
+            objects = objects[np.lexsort((firsts[objects], -sizes[objects]))]
+        else:
+            objects = objects[np.argsort(-sizes[objects])]
+        ranks = np.zeros(num_labels + 1, dtype=int)
+        ranks[objects] = np.arange(1, len(objects) + 1)
+        if max_label > 0:
+            ranks[ranks > max_label] = 0
+        ranks = ranks[parents]
+        for slab in _slabs(labeled.shape, labeled.itemsize):
+            labeled[slab] = ranks[labeled[slab]]
+        save(out_filepath, labeled, affine=obj.affine, header=obj.header)
+
+
+# ======================================================================
+def _stream_stats(
+        arr,
+        mask=None,
+        removes=(np.nan, np.inf, -np.inf),
+        val_interval=None):
     """
+    Calculate array statistical information, reading the array by slabs.
 
-    def _find_objects(array, structure, max_label):
-        labels, masks = mrt.segmentation.find_objects(array, structure,
-                                                      max_label, False)
-        return labels
+    This computes the same values as `utils.calc_stats()`, but it never
+    holds more than one slab of the (masked) values in memory.
+    The partial results of each slab are combined using the pairwise
+    update of Chan et al. (a chunked version of Welford's algorithm).
 
-    simple_filter_1_1(
-        in_filepath, out_filepath,
-        _find_objects, structure, max_label)
+    Args:
+        arr (np.ndarray|nib.arrayproxy.ArrayProxy): The input array.
+        mask (np.ndarray|nib.arrayproxy.ArrayProxy|None): The mask array.
+            Its shape must match the leading axes of the shape of `arr`.
+            If None, all values are used.
+        removes (iterable): Values to remove.
+            If empty, no values will be removed.
+        val_interval (tuple|None): The (min, max) values interval.
+            If None, all values are used.
+
+    Returns:
+        stats_dict (dict): Dictionary of statistical values.
+            See `utils.calc_stats()` for more.
+    """
+    stats_dict = {
+        'avg': None, 'std': None,
+        'min': None, 'max': None,
+        'sum': None, 'num': None}
+    num, avg, sq_diffs = 0, 0.0, 0.0
+    # statistics do not depend on the order: use the slabs contiguous on disk
+    if mask is None:
+        slabs = (
+            np.asanyarray(arr[slab])
+            for slab in _slabs(arr.shape, np.dtype(np.float64).itemsize))
+    else:
+        slabs = _masked_slabs(arr, mask)
+    for values in slabs:
+        values = mrt.utils.ravel_clean(values, removes)
+        if val_interval is not None and len(values) > 0:
+            values = values[
+                (values >= val_interval[0]) & (values <= val_interval[1])]
+        if len(values) == 0:
+            continue
+        slab_num = len(values)
+        slab_avg = np.mean(values)
+        slab_sq_diffs = np.sum((values - slab_avg) ** 2)
+        delta = slab_avg - avg
+        num += slab_num
+        avg += delta * slab_num / num
+        sq_diffs += \
+            slab_sq_diffs + delta ** 2 * (num - slab_num) * slab_num / num
+        if stats_dict['num'] is None:
+            stats_dict.update(
+                min=np.min(values), max=np.max(values), sum=np.sum(values))
+        else:
+            stats_dict.update(
+                min=min(stats_dict['min'], np.min(values)),
+                max=max(stats_dict['max'], np.max(values)),
+                sum=stats_dict['sum'] + np.sum(values))
+        stats_dict.update(avg=avg, std=np.sqrt(sq_diffs / num), num=num)
+    return stats_dict
 
 
 # ======================================================================
@@ -997,13 +1725,33 @@ def calc_stats(
     See Also:
         utils.calc_stats
     """
-    arr = load(arr_filepath)
-    if mask_filepath:
-        obj_mask = nib.load(mask_filepath)
-        mask = obj_mask.get_data().astype(bool)
+    obj = _load_obj(arr_filepath, os.path.getmtime(arr_filepath))
+    if int(np.prod(obj.shape)) * np.dtype(np.float64).itemsize <= _SLAB_BYTES:
+        arr = load(arr_filepath)
+        if mask_filepath:
+            obj_mask = _load_obj(
+                mask_filepath, os.path.getmtime(mask_filepath))
+            mask = np.asarray(obj_mask.dataobj, dtype=bool)
+        else:
+            mask = slice(None)
+        return mrt.utils.calc_stats(arr[mask], *args, **kwargs)
     else:
-        mask = slice(None)
-    return mrt.utils.calc_stats(arr[mask], *args, **kwargs)
+        params = inspect.signature(mrt.utils.calc_stats).bind(
+            None, *args, **kwargs)
+        params.apply_defaults()
+        params = params.arguments
+        if mask_filepath:
+            obj_mask = _load_obj(
+                mask_filepath, os.path.getmtime(mask_filepath))
+            mask = obj_mask.dataobj
+        else:
+            mask = None
+        stats_dict = _stream_stats(
+            obj.dataobj, mask, params['removes'], params['val_interval'])
+        mrt.utils.report_stats(
+            stats_dict, params['save_path'], params['title'],
+            params['compact'])
+        return stats_dict
 
 
 # ======================================================================
@@ -1014,17 +1762,85 @@ def change_data_type(
     """
     Change image data type.
 
+    For large images, the conversion is performed slab by slab into a
+    memory-mapped temporary file (in the output directory), so that neither
+    the input nor the output array need to be fully loaded in memory.
+    Small images (up to `_SLAB_BYTES`) are converted directly in memory.
+
     Args:
         in_filepath (str): The input file path
         out_filepath (str): The output file path
         data_type (dtype): The data type
+            Must be supported by NIfTI-1 (e.g. float16 is not), or bool.
 
     Returns:
         None
+
+    Raises:
+        nib.spatialimages.HeaderDataError: If `data_type` is not supported.
+    """
+    data_type = np.dtype(data_type)
+    if data_type != bool:
+        # fail before any conversion if the result cannot be saved
+        nib.Nifti1Header().set_data_dtype(data_type)
+    obj = _load_obj(in_filepath, os.path.getmtime(in_filepath))
+    proxy = obj.dataobj
+    if int(np.prod(proxy.shape)) * data_type.itemsize <= _SLAB_BYTES:
+        # the data is cast while reading (no copy if already `data_type`)
+        arr = np.asarray(proxy, dtype=data_type)
+        save(out_filepath, arr, affine=obj.affine, header=obj.header)
+    else:
+        out_dirpath = os.path.dirname(os.path.abspath(out_filepath))
+        with tempfile.TemporaryFile(dir=out_dirpath) as tmp_file:
+            # column-major, so that the slabs are contiguous, as on disk
+            arr = np.memmap(
+                tmp_file, dtype=data_type, mode='w+', shape=proxy.shape,
+                order='F')
+            for slab in _slabs(arr.shape, arr.itemsize):
+                arr[slab] = np.asanyarray(proxy[slab])
+            save(out_filepath, arr, affine=obj.affine, header=obj.header)
+
+
+# ======================================================================
+def _pixdim(
+        obj,
+        ndim):
     """
-    arr, meta = load(in_filepath, meta=True)
-    save(
-        out_filepath, arr.astype(data_type), **{k: v for k, v in meta.items()})
+    Get the voxel size of a NiBabel-supported image from its header.
+
+    Args:
+        obj (nib.spatialimages.SpatialImage): The NiBabel image object.
+        ndim (int): The number of dimensions to consider.
+
+    Returns:
+        pixdim (np.ndarray[float]): The voxel size along each dimension.
+            Values are rounded to 3 decimals.
+    """
+    return np.round(
+        np.asarray(obj.header['pixdim'][1:ndim + 1], dtype=np.float64), 3)
+
+
+# ======================================================================
+@functools.lru_cache(maxsize=128)
+def _resolution(
+        in_filepath,
+        mtime):
+    """
+    Get the resolution (voxel size) of a NiBabel-supported image.
+
+    The result is cached, so that the header is not parsed again when
+    the same file is plotted multiple times.
+
+    Args:
+        in_filepath (str): The input file path.
+        mtime (float): The modification time of the input file.
+            This is only used to invalidate the cache if the file changes.
+
+    Returns:
+        resolution (tuple[float]): The voxel size along each dimension.
+    """
+    obj = _load_obj(in_filepath, mtime)
+    return tuple(_pixdim(obj, len(obj.shape)).tolist())
 
 
 # ======================================================================
@@ -1048,11 +1864,11 @@ def plot_sample2d(
     See Also:
         pymrt.plot
     """
-    obj = nib.load(in_filepath)
-    arr = obj.get_data()
+    obj = _load_obj(in_filepath, os.path.getmtime(in_filepath))
+    arr = np.asanyarray(obj.dataobj)
     if 'resolution' not in kwargs:
         resolution = np.array(
-            [round(x, 3) for x in obj.get_header()['pixdim'][1:arr.ndim + 1]])
+            _resolution(in_filepath, os.path.getmtime(in_filepath)))
         kwargs.update({'resolution': resolution})
     result = pmp.sample2d(arr, *args, **kwargs)
     return result
@@ -1079,11 +1895,11 @@ def plot_sample2d_anim(
     See Also:
         plot
     """
-    obj = nib.load(in_filepath)
-    arr = obj.get_data()
+    obj = _load_obj(in_filepath, os.path.getmtime(in_filepath))
+    arr = np.asanyarray(obj.dataobj)
     if 'resolution' not in kwargs:
         resolution = np.array(
-            [round(x, 3) for x in obj.get_header()['pixdim'][1:arr.ndim + 1]])
+            _resolution(in_filepath, os.path.getmtime(in_filepath)))
         kwargs.update({'resolution': resolution})
     mov = pmp.sample2d_anim(arr, *args, **kwargs)
     return mov
@@ -1112,14 +1928,13 @@ def plot_histogram1d(
     See Also:
         plot
     """
-    obj = nib.load(in_filepath)
-    arr = obj.get_data().astype(np.double)
+    obj = _load_obj(in_filepath, os.path.getmtime(in_filepath))
     if mask_filepath:
-        obj_mask = nib.load(mask_filepath)
-        mask = obj_mask.get_data().astype(bool)
+        obj_mask = _load_obj(mask_filepath, os.path.getmtime(mask_filepath))
+        arr = _masked_values(obj.dataobj, obj_mask.dataobj, np.float64)
     else:
-        mask = slice(None)
-    result = pmp.histogram1d(arr[mask], *args, **kwargs)
+        arr = np.asarray(obj.dataobj, dtype=np.float64)
+    result = pmp.histogram1d(arr, *args, **kwargs)
     return result
 
 
@@ -1147,15 +1962,17 @@ def plot_histogram1d_list(
         plot
     """
     if mask_filepath:
-        obj_mask = nib.load(mask_filepath)
-        mask = obj_mask.get_data().astype(bool)
-    else:
-        mask = slice(None)
+        # the mask is shared by all images: it is loaded only once
+        obj_mask = _load_obj(mask_filepath, os.path.getmtime(mask_filepath))
+        mask = np.asarray(obj_mask.dataobj, dtype=bool)
     arr_list = []
     for in_filepath in in_filepaths:
-        obj = nib.load(in_filepath)
-        arr = obj.get_data()
-        arr_list.append(arr[mask])
+        obj = _load_obj(in_filepath, os.path.getmtime(in_filepath))
+        if mask_filepath:
+            arr = _masked_values(obj.dataobj, mask)
+        else:
+            arr = np.asanyarray(obj.dataobj)
+        arr_list.append(arr)
     result = pmp.histogram1d_list(arr_list, *args, **kwargs)
     return result
 
@@ -1187,22 +2004,31 @@ def plot_histogram2d(
     See Also:
         plot.histogram2d
     """
-    obj1 = nib.load(in1_filepath)
-    obj2 = nib.load(in2_filepath)
-    arr1 = obj1.get_data().astype(np.double)
-    arr2 = obj2.get_data().astype(np.double)
+    obj1 = _load_obj(in1_filepath, os.path.getmtime(in1_filepath))
+    obj2 = _load_obj(in2_filepath, os.path.getmtime(in2_filepath))
+    mask1 = mask2 = None
     if mask1_filepath:
-        obj1_mask = nib.load(mask1_filepath)
-        mask1 = obj1_mask.get_data().astype(bool)
-    else:
-        mask1 = slice(None)
+        mask1 = _load_obj(
+            mask1_filepath, os.path.getmtime(mask1_filepath)).dataobj
     if mask2_filepath:
-        obj2_mask = nib.load(mask2_filepath)
-        mask2 = obj2_mask.get_data().astype(bool)
+        if mask1_filepath and \
+                os.path.realpath(mask1_filepath) == \
+                os.path.realpath(mask2_filepath):
+            # the same mask is used for both: it is loaded only once
+            mask1 = mask2 = np.asarray(mask1, dtype=bool)
+        else:
+            mask2 = _load_obj(
+                mask2_filepath, os.path.getmtime(mask2_filepath)).dataobj
+    if mask1 is not None:
+        arr1 = _masked_values(obj1.dataobj, mask1, np.float64)
+    else:
+        arr1 = np.asarray(obj1.dataobj, dtype=np.float64)
+    if mask2 is not None:
+        arr2 = _masked_values(obj2.dataobj, mask2, np.float64)
     else:
-        mask2 = slice(None)
+        arr2 = np.asarray(obj2.dataobj, dtype=np.float64)
     result = \
-        pmp.histogram2d(arr1[mask1], arr2[mask2], *args, **kwargs)
+        pmp.histogram2d(arr1, arr2, *args, **kwargs)
 
     return result
 
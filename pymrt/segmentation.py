@@ -62,6 +62,16 @@ from pymrt import msg, dbg
 # TODO: implement other types of segmentations?
 
 
+# ======================================================================
+# :: Custom defined constants
+
+# :: comparison operators accepted for thresholding
+_COMPARISONS = {
+    '==': np.equal, '!=': np.not_equal,
+    '>': np.greater, '<': np.less,
+    '>=': np.greater_equal, '<=': np.less_equal}
+
+
 # ======================================================================
 def threshold_relative(
         arr,
@@ -603,17 +613,55 @@ def threshold_to_mask(
     Returns:
         mask (np.ndarray[bool]): Mask for which comparison is True.
     """
-    # for security reasons comparison is checked before eval
-    comparisons = ('==', '!=', '>', '<', '>=', '<=')
-    if comparison in comparisons:
-        mask = eval('arr {c} threshold'.format(c=comparison))
+    if comparison in _COMPARISONS:
+        mask = _COMPARISONS[comparison](arr, threshold)
     else:
+        comparisons = tuple(_COMPARISONS.keys())
         raise ValueError(
             'valid comparisons are: {comparisons}'
             ' (given: {comparison})'.format_map(locals()))
     return mask
 
 
+# ======================================================================
+def mask_threshold(
+        arr,
+        threshold=0.0,
+        comparison='>',
+        mode='absolute'):
+    """
+    Extract a mask from an array using a threshold.
+
+    Args:
+        arr (np.ndarray): Input array for the masking.
+        threshold (int|float): Value to be used for determining the threshold.
+        comparison (str): A string representing the numeric relationship
+            Accepted values are: ['==', '!=', '>', '<', '>=', '<=']
+        mode (str): Determines how to interpret the threshold value.
+            Accepted values are:
+             - 'absolute': use the value as is.
+             - 'relative': use `threshold_relative()`.
+             - 'percentile': use `threshold_percentile()`.
+
+    Returns:
+        mask (np.ndarray[bool]): Mask for which comparison is True.
+
+    Raises:
+        ValueError: If `mode` is unknown.
+    """
+    modes = ('absolute', 'relative', 'percentile')
+    if mode:
+        mode = mode.lower()
+    if mode == 'relative':
+        threshold = threshold_relative(arr, threshold)[0]
+    elif mode == 'percentile':
+        threshold = threshold_percentile(arr, threshold)[0]
+    elif mode != 'absolute':
+        raise ValueError(
+            'valid modes are: {} (given: {})'.format(modes, mode))
+    return threshold_to_mask(arr, threshold, comparison)
+
+
 # ======================================================================
 def label_thresholds(
         arr,
@@ -1661,15 +1661,14 @@ def set_keyword_parameters(
         kw_params (dict): A dictionary of the keyword parameters to set.
 
     See Also:
-        inspect.getargspec, locals, globals.
+        inspect.getfullargspec, locals, globals.
     """
-    # todo: refactor to get rid of deprecated getargspec
-    inspected = inspect.getargspec(func)
+    inspected = inspect.getfullargspec(func)
     defaults = dict(
-        zip(reversed(inspected.args), reversed(inspected.defaults)))
+        zip(reversed(inspected.args), reversed(inspected.defaults or ())))
     kw_params = {}
     for key in inspected.args:
-        if key in values:
+        if key in values and (values[key] is not None or key not in defaults):
             kw_params[key] = values[key]
         elif key in defaults:
             kw_params[key] = defaults[key]
@@ -6076,6 +6075,33 @@ def calc_stats(
             'max': np.max(arr),
             'sum': np.sum(arr),
             'num': np.size(arr), }
+    report_stats(stats_dict, save_path, title, compact)
+    return stats_dict
+
+
+# ======================================================================
+def report_stats(
+        stats_dict,
+        save_path=None,
+        title=None,
+        compact=False):
+    """
+    Save and/or print array statistical information.
+
+    Args:
+        stats_dict (dict): Dictionary of statistical values.
+            See `calc_stats()` for more.
+        save_path (str|None): The path to which the plot is to be saved.
+            If None, no output.
+        title (str|None): If title is not None, stats are printed to screen.
+        compact (bool): Use a compact format string for displaying results.
+
+    Returns:
+        None.
+
+    See Also:
+        calc_stats()
+    """
     if save_path or title:
         label_list = ['avg', 'std', 'min', 'max', 'sum', 'num']
         val_list = []
@@ -6095,7 +6121,6 @@ def calc_stats(
             else:
                 print_str += '{}={}, '.format(label, stats_dict[label])
         print(print_str)
-    return stats_dict
 
 
 # ======================================================================